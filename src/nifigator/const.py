@@ -21,6 +21,8 @@ TermOccurrence = "TermOccurrence"
 NIF = Namespace("http://persistence.uni-leipzig.org/nlp2rdf/ontologies/nif-core#")
 NIF_ONTOLOGY = "http://persistence.uni-leipzig.org/nlp2rdf/ontologies/nif-core/2.1"
 OLIA = Namespace("http://purl.org/olia/olia.owl#")
+# plain str prefix of OLIA, matched with str.startswith instead of Namespace
+OLIA_PREFIX = str(OLIA)
 ITSRDF = Namespace("http://www.w3.org/2005/11/its/rdf#")
 NIFVEC = Namespace("http://mangosaurus.eu/ontology/nifvec#")
 
@@ -281,10 +283,10 @@ UD2OLIA_mappings = {
 
 
 def mapobject(p: str = "", o: str = ""):
-    if p not in UD2OLIA_mappings.keys():
+    if p not in UD2OLIA_mappings:
         print("UD Not found: " + p)
     else:
-        if o not in UD2OLIA_mappings[p].keys():
+        if o not in UD2OLIA_mappings[p]:
             print("UD Not found: " + p + " , " + o)
     return (
         UD2OLIA_mappings.get(p, {})
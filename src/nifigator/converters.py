@@ -6,7 +6,7 @@ import logging
 from rdflib.namespace import DC, DCTERMS, XSD
 from rdflib.term import Literal, URIRef
 
-from .const import OLIA, mapobject
+from .const import OLIA, EntityOccurrence, mapobject
 from .nafdocument import NafDocument
 from .nifobjects import (
     NifContext,
@@ -27,11 +27,110 @@ def nafConverter(
     base_prefix: str = None,
     URIScheme: str = None,
 ):
-    collection_uri = base_uri + collection_name
-    context_uri = base_uri + context_name
-
     # create nif:collection
-    nif_collection = NifContextCollection(uri=collection_uri)
+    nif_collection = NifContextCollection(uri=base_uri + collection_name)
+
+    # create nif:context with nif:sentence and nif:word
+    nif_context, doc_words, doc_terms = _nafContext(
+        context_name=context_name,
+        nafdocument=nafdocument,
+        base_uri=base_uri,
+        URIScheme=URIScheme,
+    )
+    nif_collection.add_context(nif_context)
+
+    # create nif:page, nif:phrase and nif:paragraph
+    nif_context.set_Pages(
+        list(_nafPages(context_name, nafdocument, nif_context, base_uri, URIScheme))
+    )
+    nif_context.set_Phrases(
+        list(
+            _nafPhrases(
+                context_name,
+                nafdocument,
+                nif_context,
+                doc_words,
+                doc_terms,
+                base_uri,
+                URIScheme,
+            )
+        )
+    )
+    nif_context.set_Paragraphs(
+        list(
+            _nafParagraphs(
+                context_name, nafdocument, nif_context, doc_words, base_uri, URIScheme
+            )
+        )
+    )
+
+    return nif_collection
+
+
+def nafConverterTriples(
+    collection_name: str = None,
+    context_name: str = None,
+    nafdocument: NafDocument = None,
+    base_uri: str = None,
+    base_prefix: str = None,
+    URIScheme: str = None,
+):
+    """
+    Generates the triples of a NAF document converted to NIF
+
+    The triples are the same as those of nafConverter(...).triples(), but the
+    pages, phrases and paragraphs are generated one by one instead of being
+    collected in the context first.
+
+    """
+    nif_collection = NifContextCollection(uri=base_uri + collection_name)
+    nif_context, doc_words, doc_terms = _nafContext(
+        context_name=context_name,
+        nafdocument=nafdocument,
+        base_uri=base_uri,
+        URIScheme=URIScheme,
+    )
+    nif_collection.add_context(nif_context)
+    for triple in nif_collection.triples():
+        yield triple
+
+    for nif_page in _nafPages(
+        context_name, nafdocument, nif_context, base_uri, URIScheme
+    ):
+        for triple in nif_page.triples():
+            yield triple
+    for nif_phrase in _nafPhrases(
+        context_name,
+        nafdocument,
+        nif_context,
+        doc_words,
+        doc_terms,
+        base_uri,
+        URIScheme,
+    ):
+        for triple in nif_phrase.triples():
+            yield triple
+    for nif_paragraph in _nafParagraphs(
+        context_name, nafdocument, nif_context, doc_words, base_uri, URIScheme
+    ):
+        for triple in nif_paragraph.triples():
+            yield triple
+
+
+def _nafContext(
+    context_name: str = None,
+    nafdocument: NafDocument = None,
+    base_uri: str = None,
+    URIScheme: str = None,
+):
+    """
+    Creates the nif:Context of a NAF document with its metadata, sentences,
+    words and dependencies
+
+    :return: the NifContext and the words and terms of the NAF document
+
+    """
+    context_uri = base_uri + context_name
 
     # create nif:context
     if nafdocument.raw is None:
@@ -46,7 +145,6 @@ def nafConverter(
         URIScheme=URIScheme,
     )
     nif_context.set_referenceContext(nif_context)
-    nif_collection.add_context(nif_context)
 
     # set metadata
     metadata = nafdocument.header["public"]
@@ -54,7 +152,7 @@ def nafConverter(
         URIRef(key.replace("{", "").replace("}", "")): Literal(
             metadata[key], datatype=XSD.string
         )
-        for key in metadata.keys()
+        for key in metadata
     }
     metadata[DC.language] = Literal(nafdocument.language, datatype=XSD.string)
     metadata[DCTERMS.created] = Literal(
@@ -175,15 +273,41 @@ def nafConverter(
             )
             doc_terms[term["id"]]["nif"] = nif_term
 
-            if nif_term.uri not in nif_words.keys():
+            if nif_term.uri not in nif_words:
                 nif_words[nif_term.uri] = nif_term
             else:
                 nif_words[nif_term.uri].set_lemma(term_lemma)
                 nif_words[nif_term.uri].set_pos(term_pos)
                 nif_words[nif_term.uri].set_morphofeats(term_morphofeats)
 
+    # Add dependencies:
+    for dep in nafdocument.deps:
+        from_term = doc_terms[dep["from_term"]]
+        to_term = doc_terms[dep["to_term"]]
+        rfunc = dep["rfunc"]
+        if "nif" in from_term and "nif" in to_term:
+            from_term["nif"].add_dependency(to_term["nif"])
+            from_term["nif"].set_dependencyRelationType(rfunc)
+        else:
+            if "nif" not in from_term:
+                logging.warning(".. from term in dependency not found:\n%s", from_term)
+            if "nif" not in to_term:
+                logging.warning(".. to term in dependency not found:\n%s", to_term)
+
+    return nif_context, doc_words, doc_terms
+
+
+def _nafPages(
+    context_name: str = None,
+    nafdocument: NafDocument = None,
+    nif_context: NifContext = None,
+    base_uri: str = None,
+    URIScheme: str = None,
+):
+    """
+    Generates the nif:Page of a NAF document
+    """
     # create nif:page
-    nif_pages = []
     if len(nafdocument.text) > 0:
         page_number = int(nafdocument.text[0]["page"])
         page_start = int(nafdocument.text[0]["offset"])
@@ -205,7 +329,7 @@ def nafConverter(
             )
             beginIndex = int(word["offset"])
             endIndex = int(word["offset"]) + int(word["length"])
-            nif_pages.append(nif_page)
+            yield nif_page
             page_number += 1
         endIndex = int(word["offset"]) + int(word["length"])
     nif_page = NifPage(
@@ -215,12 +339,22 @@ def nafConverter(
         uri=base_uri + context_name,
         URIScheme=URIScheme,
     )
-    nif_pages.append(nif_page)
+    yield nif_page
 
-    nif_context.set_Pages(page for page in nif_pages)
 
+def _nafPhrases(
+    context_name: str = None,
+    nafdocument: NafDocument = None,
+    nif_context: NifContext = None,
+    doc_words: dict = None,
+    doc_terms: dict = None,
+    base_uri: str = None,
+    URIScheme: str = None,
+):
+    """
+    Generates the nif:Phrase of the entities in a NAF document
+    """
     # create nif:phrases
-    nif_phrases = []
     for entity in nafdocument.entities:
         taClassRef = "https://stanfordnlp.github.io/stanza#" + entity.get(
             "type", "unknown"
@@ -237,29 +371,24 @@ def nafConverter(
             endIndex=endIndex,
             referenceContext=nif_context,
             taClassRef=URIRef(taClassRef),
-            entityOccurrence=True,
+            PhraseType=EntityOccurrence,
             uri=base_uri + context_name,
             URIScheme=URIScheme,
         )
-        nif_phrases.append(nif_phrase)
-    nif_context.set_Phrases(nif_phrases)
+        yield nif_phrase
 
-    # Add dependencies:
-    for dep in nafdocument.deps:
-        from_term = doc_terms[dep["from_term"]]
-        to_term = doc_terms[dep["to_term"]]
-        rfunc = dep["rfunc"]
-        if "nif" in from_term.keys() and "nif" in to_term.keys():
-            from_term["nif"].add_dependency(to_term["nif"])
-            from_term["nif"].set_dependencyRelationType(rfunc)
-        else:
-            if "nif" not in from_term.keys():
-                logging.warning(
-                    ".. from term in dependency not found:\n" + str(from_term)
-                )
-            if "nif" not in to_term.keys():
-                logging.warning(".. to term in dependency not found:\n" + str(to_term))
 
+def _nafParagraphs(
+    context_name: str = None,
+    nafdocument: NafDocument = None,
+    nif_context: NifContext = None,
+    doc_words: dict = None,
+    base_uri: str = None,
+    URIScheme: str = None,
+):
+    """
+    Generates the nif:Paragraph of a NAF document
+    """
     # create nif:paragraph
     doc_paragraphs = nafdocument.paragraphs
     for para_idx, paragraph in enumerate(doc_paragraphs):
@@ -276,8 +405,4 @@ def nafConverter(
                 uri=base_uri + context_name,
                 URIScheme=URIScheme,
             )
-            paragraph["nif"] = nif_paragraph
-
-    nif_context.set_Paragraphs(paragraph["nif"] for paragraph in doc_paragraphs)
-
-    return nif_collection
+            yield nif_paragraph
@@ -8,13 +8,23 @@ from zipfile import ZipFile
 
 import rdflib
 from rdflib import Graph
-from rdflib.namespace import DC, DCTERMS, NamespaceManager
+from rdflib.namespace import DC, DCTERMS, RDF, NamespaceManager
 from rdflib.store import Store
 from rdflib.term import IdentifiedNode, URIRef, Literal
 from rdflib.plugins.stores import sparqlstore
 from iribaker import to_iri
 
-from .const import ITSRDF, NIF, OLIA, ONTOLEX, DECOMP, LEXINFO, TBX, SKOS
+from .const import (
+    ITSRDF,
+    NIF,
+    OLIA,
+    OLIA_PREFIX,
+    ONTOLEX,
+    DECOMP,
+    LEXINFO,
+    TBX,
+    SKOS,
+)
 
 DEFAULT_URI = "https://mangosaurus.eu/rdf-data/"
 DEFAULT_PREFIX = "mangosaurus"
@@ -132,12 +142,10 @@ class LemonGraph(Graph):
             if file[-3:].lower() == "zip":
                 # if zip file then parse all files in zip
                 with ZipFile(file, mode="r") as zipfile:
-                    logging.info(".. Reading zip file " + file)
+                    logging.info(".. Reading zip file %s", file)
                     for filename in zipfile.namelist():
                         with zipfile.open(filename) as f:
-                            logging.info(
-                                ".. Parsing file " + filename + " from zip file"
-                            )
+                            logging.info(".. Parsing file %s from zip file", filename)
                             if filename[-4:].lower() == "hext":
                                 self.parse(data=f.read().decode(), format="hext")
                             elif filename[-3:].lower() == "ttl":
@@ -147,12 +155,12 @@ class LemonGraph(Graph):
             elif file[-4:].lower() == "hext":
                 # if file ends with .hext then parse as hext file
                 with open(file, encoding="utf-8") as f:
-                    logging.info(".. Parsing file " + file + "")
+                    logging.info(".. Parsing file %s", file)
                     self.parse(data=f.read(), format="hext")
             else:
                 # otherwise let rdflib determine format
                 with open(file, encoding="utf-8") as f:
-                    logging.info(".. Parsing file " + file + "")
+                    logging.info(".. Parsing file %s", file)
                     self.parse(data=f.read())
 
     # @property
@@ -211,7 +219,16 @@ class LemonGraph(Graph):
         lexicon = Lexicon(uri=collection_uri)
         return lexicon
 
-    def query_rdf_type(self, rdf_type: URIRef = None):
+    def __rdf_type_statements(self, rdf_type: URIRef = None):
+        """
+        Generates all statements of the subjects with the given rdf:type
+
+        For local stores the graph indices are traversed directly, remote
+        stores are queried with SPARQL.
+
+        :param rdf_type: the rdf:type of the subjects
+
+        """
         if isinstance(self.store, sparqlstore.SPARQLUpdateStore):
             q = (
                 """
@@ -228,18 +245,15 @@ class LemonGraph(Graph):
                 }
             }"""
             )
+            for s, p, o in self.query(q):
+                yield (s, p, o)
         else:
-            q = (
-                """
-            SELECT ?s ?p ?o
-            WHERE {
-                ?s rdf:type """
-                + rdf_type.n3(self.namespace_manager)
-                + """ .
-                ?s ?p ?o .
-            }"""
-            )
-        results = self.query(q)
+            for s in self.subjects(RDF.type, rdf_type):
+                for p, o in self.predicate_objects(subject=s):
+                    yield (s, p, o)
+
+    def query_rdf_type(self, rdf_type: URIRef = None):
+        results = self.__rdf_type_statements(rdf_type)
 
         d = defaultdict(dict)
         for result in results:
@@ -247,16 +261,10 @@ class LemonGraph(Graph):
             col = result[1]
             val = result[2]
 
-            if col == NIF.hasContext:
-                if col in d[idx].keys():
-                    d[idx][col].append(val)
-                else:
-                    d[idx][col] = [val]
-            elif val in OLIA:
-                if col in d[idx].keys():
-                    d[idx][col].append(val)
-                else:
-                    d[idx][col] = [val]
+            if col == NIF.hasContext or (
+                isinstance(val, URIRef) and val.startswith(OLIA_PREFIX)
+            ):
+                d[idx].setdefault(col, []).append(val)
             else:
                 d[idx][col] = val
 
@@ -886,9 +886,7 @@ class LexicalEntry(HasLanguage, HasPatterns, LemonBase, LemonElement):
             for _, _, o in graph.triples((uri, ONTOLEX.canonicalForm, None))
         ]
         if len(forms) > 1:
-            logging.error(
-                "More than one canonicalForms of LexicalEntry [" + str(uri) + "]"
-            )
+            logging.error("More than one canonicalForms of LexicalEntry [%s]", uri)
         else:
             for form in forms:
                 self.set_canonicalForm(form)
@@ -272,7 +272,7 @@ class NafDocument(etree._ElementTree):
             if item["sent"] == str(sent_num):
                 sentence_list.append(item["text"])
                 span.append({"id": item["id"]})
-                if item["id"] in word2term.keys():
+                if item["id"] in word2term:
                     terms.append({"id": word2term.get(item["id"])})
                 pages.add(item.get("page", "0"))
                 para.add(item.get("para", "0"))
@@ -294,7 +294,7 @@ class NafDocument(etree._ElementTree):
                 span = list()
                 terms = list()
                 span.append({"id": item["id"]})
-                if item["id"] in word2term.keys():
+                if item["id"] in word2term:
                     terms.append({"id": word2term.get(item["id"])})
                 pages.add(item.get("page", "0"))
                 para.add(item.get("para", "0"))
@@ -319,7 +319,7 @@ class NafDocument(etree._ElementTree):
         """Returns paragraphs of the NAF document as list of dicts"""
 
         # return empty list if no para attributes are included
-        if any(["para" not in item.keys() for item in self.text]):
+        if any(["para" not in item for item in self.text]):
             return []
 
         word2term = {
@@ -337,7 +337,7 @@ class NafDocument(etree._ElementTree):
             if item["para"] == str(para_num):
                 paragraph_list.append(item["text"])
                 span.append({"id": item["id"]})
-                if item["id"] in word2term.keys():
+                if item["id"] in word2term:
                     terms.append({"id": word2term.get(item["id"])})
                 pages.add(item.get("page", "0"))
                 para.add(item.get("para", "0"))
@@ -361,7 +361,7 @@ class NafDocument(etree._ElementTree):
                 span = list()
                 terms = list()
                 span.append({"id": item["id"]})
-                if item["id"] in word2term.keys():
+                if item["id"] in word2term:
                     terms.append({"id": word2term.get(item["id"])})
                 pages.add(item.get("page", "0"))
                 para.add(item.get("para", "0"))
@@ -593,7 +593,7 @@ class NafDocument(etree._ElementTree):
                 qname = etree.QName("{" + namespace + "}" + key, key)
                 del data[key]
                 data[qname] = value
-        for key in dict(data).keys():
+        for key in dict(data):
             if key in exclude:
                 del data[key]
         return data
@@ -39,7 +39,7 @@ class NafBase(object):
                 qname = etree.QName("{" + namespace + "}" + key, key)
                 del data[key]
                 data[qname] = value
-        for key in dict(data).keys():
+        for key in dict(data):
             if key in exclude:
                 del data[key]
         return data
@@ -136,7 +136,7 @@ class NafHeaderLayer(NafBase):
 
     def __repr__(self):
         if self._metadata is not None and self._metadata != {}:
-            for d in self._metadata.keys():
+            for d in self._metadata:
                 s += f"  {d} : {self._metadata[d]}\n"
         return s
 
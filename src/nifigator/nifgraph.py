@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
 
+import io
 import logging
-import uuid
+import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
+from itertools import islice, repeat
 from typing import Optional, Union, List
 from zipfile import ZipFile
 import pandas as pd
@@ -13,19 +17,118 @@ from rdflib.namespace import DC, RDF, DCTERMS, NamespaceManager
 from rdflib.store import Store
 from rdflib.term import IdentifiedNode, URIRef, Literal
 from rdflib.plugins.stores import sparqlstore
+from rdflib.plugins.stores.memory import Memory, SimpleMemory
 from iribaker import to_iri
 
-from .converters import nafConverter
+from .converters import nafConverterTriples
 from .nafdocument import NafDocument
 from .nifobjects import (
     NifContext,
     NifContextCollection,
     NifSentence,
 )
-from .utils import tokenize_text
-from .const import ITSRDF, NIF, OLIA, DEFAULT_URI, DEFAULT_PREFIX
+from .utils import tokenize_text, generate_uuid
+from .const import ITSRDF, NIF, OLIA, OLIA_PREFIX, DEFAULT_URI, DEFAULT_PREFIX
 from .lemonobjects import Lexicon, LexicalEntry, Form
 
+# read buffer for zip members, prevents the parser reading small chunks
+ZIP_BUFFER_SIZE = 1 << 20
+
+# parser format by file extension, for other extensions rdflib guesses the format
+FILE_FORMATS = {
+    ".hext": "hext",
+    ".ttl": "turtle",
+    ".nt": "nt",
+    # binary Jelly RDF, parser plugin is provided by pyjelly (extra "jelly")
+    ".jelly": "jelly",
+}
+
+# parser format by file extension of the Rust-based parsers of oxrdflib
+# (extra "oxigraph"), only used with parser="oxigraph"
+OXIGRAPH_FILE_FORMATS = {
+    ".ttl": "ox-turtle",
+    ".nt": "ox-ntriples",
+}
+
+PARSERS = ("rdflib", "oxigraph")
+
+
+def _file_format(filename: str = None, parser: str = "rdflib"):
+    """
+    Returns the parser format of a file
+
+    :param filename: the name of the file
+
+    :param parser: "rdflib" or "oxigraph"
+
+    :return: the format by extension, None if rdflib guesses the format
+
+    """
+    ext = os.path.splitext(filename)[1].lower()
+    if parser == "oxigraph" and ext in OXIGRAPH_FILE_FORMATS:
+        return OXIGRAPH_FILE_FORMATS[ext]
+    return FILE_FORMATS.get(ext)
+
+
+def _open_zip_member(zipfile: ZipFile = None, filename: str = None):
+    """
+    Opens a file within a zip file with a read buffer of ZIP_BUFFER_SIZE
+
+    :param zipfile: an opened zip file
+
+    :param filename: the name of the file within the zip file
+
+    :return: a buffered reader of the file
+
+    """
+    return io.BufferedReader(zipfile.open(filename), buffer_size=ZIP_BUFFER_SIZE)
+
+
+def _parse_zip_member(
+    graph: Graph = None,
+    zipfile: ZipFile = None,
+    filename: str = None,
+    parser: str = "rdflib",
+):
+    """
+    Parses a file within a zip file into a graph
+
+    :param graph: the graph to parse into
+
+    :param zipfile: an opened zip file
+
+    :param filename: the name of the file within the zip file
+
+    :param parser: "rdflib" or "oxigraph"
+
+    :return: the graph
+
+    """
+    with _open_zip_member(zipfile, filename) as f:
+        return graph.parse(source=f, format=_file_format(filename, parser))
+
+
+def _parse_zip_member_worker(
+    file: str = None, filename: str = None, parser: str = "rdflib"
+):
+    """
+    Parses a file within a zip file in a worker process
+
+    :param file: name of the zip file
+
+    :param filename: the name of the file within the zip file
+
+    :param parser: "rdflib" or "oxigraph"
+
+    :return: the namespaces and the triples of the parsed file
+
+    """
+    with ZipFile(file, mode="r") as zipfile:
+        graph = _parse_zip_member(
+            Graph(bind_namespaces="none"), zipfile, filename, parser
+        )
+    return list(graph.namespaces()), list(graph)
+
 
 class NifGraph(Graph):
 
@@ -91,45 +194,89 @@ class NifGraph(Graph):
         file: str = None,
         nafdocument: NafDocument = None,
         collection: NifContextCollection = None,
+        batch_size: int = 10000,
+        workers: int = None,
+        parser: str = "rdflib",
     ):
         """
         Read data from multiple sources into current `NifGraph` object.
 
-        :param file: name of the file to read
+        :param file: name of the file to read, Jelly files (".jelly") require
+            pyjelly and can be stored uncompressed (ZIP_STORED) in zip files
 
         :param nafdocument: an xml file in NLP Annotation Format
 
         :param collection: an NifContextCollection
 
+        :param batch_size: number of triples added to the store at once, None
+            adds all triples at once; files other than NAF documents are only
+            added in batches if the store is not a memory store or if a zip
+            file is parsed with workers
+
+        :param workers: number of processes that parse the files in a zip file,
+            by default the files are parsed sequentially
+
+        :param parser: "rdflib" (default) or "oxigraph", the latter parses
+            Turtle (".ttl") and N-Triples (".nt") files with the Rust-based
+            parsers of oxrdflib (extra "oxigraph"). Note that these parsers
+            read plain literals as xsd:string literals, so these are not
+            matched by a plain `Literal`, and that they keep the blank node
+            labels of the file, so blank nodes with the same label in
+            different files (e.g. within one zip file) are merged.
+
         :return: None
 
         """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(
+                "invalid batch_size, it should be at least 1 instead of "
+                + str(batch_size)
+            )
+        if parser not in PARSERS:
+            raise ValueError(
+                "invalid parser, it should be one of "
+                + ", ".join(PARSERS)
+                + " instead of "
+                + str(parser)
+            )
+        if parser == "oxigraph" and find_spec("oxrdflib") is None:
+            raise ImportError(
+                'parser "oxigraph" requires oxrdflib, install nifigator[oxigraph]'
+            )
         if file is not None:
-            self.__parse_file(file=file)
+            self.__parse_file(
+                file=file, batch_size=batch_size, workers=workers, parser=parser
+            )
         elif nafdocument is not None:
-            self.__parse_nafdocument(nafdocument=nafdocument)
+            self.__parse_nafdocument(nafdocument=nafdocument, batch_size=batch_size)
         elif collection is not None:
-            self.__parse_collection(collection=collection)
+            self.__parse_collection(collection=collection, batch_size=batch_size)
         return self
 
-    def __parse_nafdocument(self, nafdocument: NafDocument = None):
+    def __parse_nafdocument(
+        self, nafdocument: NafDocument = None, batch_size: int = 10000
+    ):
         """
         Read data from an xml file in NLP Annotation Format
 
         :param nafdocument: an xml file in NLP Annotation Format
 
+        :param batch_size: number of triples added to the store at once
+
         :return: None
 
         """
         logging.info(".. Parsing NafDocument to NifGraph")
 
         doc_uri = nafdocument.header["public"]["{http://purl.org/dc/elements/1.1/}uri"]
-        doc_uuid = "nif-" + str(uuid.uuid3(uuid.NAMESPACE_DNS, doc_uri).hex)
+        doc_uuid = generate_uuid(uri=doc_uri)
 
         base_uri = DEFAULT_URI
         base_prefix = DEFAULT_PREFIX
 
-        collection = nafConverter(
+        # the triples are added while they are generated, without first
+        # constructing the complete NifContextCollection
+        triples = nafConverterTriples(
             collection_name="collection",
             context_name=doc_uuid,
             nafdocument=nafdocument,
@@ -138,25 +285,55 @@ class NifGraph(Graph):
             URIScheme=self.URIScheme,
         )
 
-        self.__parse_collection(collection)
+        self.__add_triples(triples, batch_size=batch_size)
 
     # self.parse_collection(collection)
 
-    def __parse_collection(self, collection: NifContextCollection = None):
+    def __parse_collection(
+        self, collection: NifContextCollection = None, batch_size: int = 10000
+    ):
         """
         Read data from a NifContextCollection object.
 
+        The triples are added to the store in batches of `batch_size`, for a
+        SPARQLUpdateStore each batch is sent as one INSERT DATA request.
+
         :param collection: a NifContextCollection
 
+        :param batch_size: number of triples added to the store at once
+
         :return: None
 
         """
-        g = Graph(identifier=self.identifier)
-        for r in collection.triples():
-            g.add(r)
-        self += g
+        self.__add_triples(collection.triples(), batch_size=batch_size)
+
+    def __add_triples(self, triples=None, batch_size: int = 10000):
+        """
+        Add triples to the store in batches of `batch_size`
+
+        :param triples: an iterable of triples
+
+        :param batch_size: number of triples added to the store at once, None
+            adds all triples at once
+
+        :return: None
 
-    def __parse_file(self, file: str = None):
+        """
+        # all quads have this graph as context, so they are passed to the
+        # store directly without the context filtering of Graph.addN
+        quads = ((s, p, o, self) for s, p, o in triples)
+        batch = list(islice(quads, batch_size))
+        while batch:
+            self.store.addN(batch)
+            batch = list(islice(quads, batch_size))
+
+    def __parse_file(
+        self,
+        file: str = None,
+        batch_size: int = 10000,
+        workers: int = None,
+        parser: str = "rdflib",
+    ):
         """
         Read data from a file.
 
@@ -164,47 +341,122 @@ class NifGraph(Graph):
         an xml file in NLP Annotation Format.
         filename ending with "zip": file is extracted and content
         is parsed.
+        other files and files within a zip file are parsed with the
+        format in FILE_FORMATS by extension, else rdflib guesses the format.
 
         :param file: a filename.
 
+        :param batch_size: number of triples added to the store at once, for
+            files other than NAF documents only used if the store is not a memory
+            store or if a zip file is parsed with workers
+
+        :param workers: number of processes that parse the files in a zip file
+
+        :param parser: "rdflib" or "oxigraph"
+
         :return: None
 
         """
         if file is not None:
-            if file[-7:].lower() == "naf.xml":
-                logging.info(".. Parsing file " + file + "")
+            ext = os.path.splitext(file)[1].lower()
+            if file.lower().endswith("naf.xml"):
+                logging.info(".. Parsing file %s", file)
                 nafdocument = NafDocument().open(file)
-                self.__parse_nafdocument(nafdocument=nafdocument)
-            else:
-                if file[-3:].lower() == "zip":
-                    # if zip file then parse all files in zip
-                    with ZipFile(file, mode="r") as zipfile:
-                        logging.info(".. Reading zip file " + file)
-                        for filename in zipfile.namelist():
-                            with zipfile.open(filename) as f:
-                                logging.info(
-                                    ".. Parsing file " + filename + " from zip file"
+                self.__parse_nafdocument(nafdocument=nafdocument, batch_size=batch_size)
+            elif ext == ".zip":
+                # if zip file then parse all files in zip
+                with ZipFile(file, mode="r") as zipfile:
+                    logging.info(".. Reading zip file %s", file)
+                    filenames = zipfile.namelist()
+                    if workers is None or workers < 2 or len(filenames) < 2:
+                        for filename in filenames:
+                            logging.info(".. Parsing file %s from zip file", filename)
+                            with _open_zip_member(zipfile, filename) as f:
+                                self.__parse_source(
+                                    source=f,
+                                    format=_file_format(filename, parser),
+                                    batch_size=batch_size,
                                 )
-                                if filename[-4:].lower() == "hext":
-                                    self += Graph().parse(
-                                        data=f.read().decode(), format="hext"
-                                    )
-                                elif filename[-3:].lower() == "ttl":
-                                    self += Graph().parse(
-                                        data=f.read().decode(), format="turtle"
-                                    )
-                                else:
-                                    self += Graph().parse(data=f.read().decode())
-                elif file[-4:].lower() == "hext":
-                    # if file ends with .hext then parse as hext file
-                    with open(file, encoding="utf-8") as f:
-                        logging.info(".. Parsing file " + file + "")
-                        self += Graph().parse(data=f.read(), format="hext")
-                else:
-                    # otherwise let rdflib determine format
-                    with open(file, encoding="utf-8") as f:
-                        logging.info(".. Parsing file " + file + "")
-                        self += Graph().parse(data=f.read())
+                    else:
+                        self.__parse_zip_parallel(
+                            file=file,
+                            filenames=filenames,
+                            batch_size=batch_size,
+                            workers=workers,
+                            parser=parser,
+                        )
+            else:
+                # parse with format by extension, otherwise rdflib determines format
+                with open(file, mode="rb") as f:
+                    logging.info(".. Parsing file %s", file)
+                    self.__parse_source(
+                        source=f,
+                        format=_file_format(file, parser),
+                        batch_size=batch_size,
+                    )
+
+    def __parse_source(self, source=None, format: str = None, batch_size: int = 10000):
+        """
+        Parses a source into the graph.
+
+        A memory store is parsed into directly, for other stores (e.g. a
+        SPARQLUpdateStore) the source is parsed into a temporary graph of which
+        the triples are added to the store in batches of `batch_size`.
+
+        :param source: a file-like object
+
+        :param format: the parser format, if None then rdflib guesses the format
+
+        :param batch_size: number of triples added to the store at once
+
+        :return: None
+
+        """
+        if isinstance(self.store, (Memory, SimpleMemory)):
+            self.parse(source=source, format=format)
+        else:
+            graph = Graph(bind_namespaces="none").parse(source=source, format=format)
+            for prefix, namespace in graph.namespaces():
+                self.bind(prefix, namespace, override=False)
+            self.__add_triples(graph, batch_size=batch_size)
+
+    def __parse_zip_parallel(
+        self,
+        file: str = None,
+        filenames: list = None,
+        batch_size: int = 10000,
+        workers: int = None,
+        parser: str = "rdflib",
+    ):
+        """
+        Read the files in a zip file with a pool of worker processes.
+
+        Each worker parses a single file and returns its triples, which are
+        added to the store in the order of the files.
+
+        :param file: name of the zip file
+
+        :param filenames: the names of the files within the zip file
+
+        :param batch_size: number of triples added to the store at once
+
+        :param workers: number of processes, at most the number of cpus
+
+        :param parser: "rdflib" or "oxigraph"
+
+        :return: None
+
+        """
+        max_workers = min(workers, len(filenames), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                _parse_zip_member_worker, repeat(file), filenames, repeat(parser)
+            )
+            for filename, (namespaces, triples) in zip(filenames, results):
+                logging.info(".. Adding file %s from zip file", filename)
+                for prefix, namespace in namespaces:
+                    self.bind(prefix, namespace, override=False)
+                self.__add_triples(triples, batch_size=batch_size)
 
     @property
     def contexts(self, uri: str = DEFAULT_URI) -> list:
@@ -214,8 +466,7 @@ class NifGraph(Graph):
         return list of nif:Context in the graph
 
         """
-        uris = list(self.subjects(RDF.type, NIF.Context))
-        return [NifContext(uri=uri, graph=self) for uri in uris]
+        return list(self.__contexts_bulk().values())
 
     @property
     def collections(self, uri: str = DEFAULT_URI) -> list:
@@ -225,70 +476,131 @@ class NifGraph(Graph):
         return list of `nif:ContextCollection` in the graph
 
         """
-        uris = list(self.subjects(RDF.type, NIF.ContextCollection))
-        return [NifContextCollection(uri=uri, graph=self) for uri in uris]
+        by_pred, by_pred_list = self.query_rdf_type(NIF.ContextCollection)
+        collection_uris = list(by_pred[RDF.type])
+        logging.info(".... found %d collections.", len(collection_uris))
+        if not collection_uris:
+            return []
+
+        # a context referenced by more than one collection is constructed once
+        contexts = self.__contexts_bulk()
+        collections = list()
+        for collection_uri in collection_uris:
+            context_uris = by_pred_list[NIF.hasContext].get(collection_uri, [])
+            for context_uri in context_uris:
+                if context_uri not in contexts:
+                    contexts[context_uri] = NifContext(
+                        URIScheme=self.URIScheme,
+                        uri=context_uri,
+                        graph=self,
+                    )
+            collections.append(
+                NifContextCollection(
+                    uri=collection_uri,
+                    hasContext=[contexts[context_uri] for context_uri in context_uris],
+                    conformsTo=by_pred[DCTERMS.conformsTo].get(collection_uri, None),
+                    graph=self,
+                )
+            )
+        return collections
 
     @property
     def collection(self, uri: str = DEFAULT_URI) -> NifContextCollection:
         """
         This property constructs and returns the first nif:ContextCollection from the NifGraph.
 
+        If the graph contains no nif:ContextCollection then a collection with
+        all nif:Context in the graph is returned.
+
         return the first nif:ContextCollection in the graph
 
         """
-        for uri in list(self.subjects(RDF.type, NIF.ContextCollection)):
-            return NifContextCollection(uri=uri, graph=self)
-
-        # dict_collections = self.query_rdf_type(NIF.ContextCollection)
-        # dict_context = self.query_rdf_type(NIF.Context)
-        # logging.info(".. extracting nif statements")
-        # logging.info(
-        #     ".... found " + str(len(dict_collections.keys())) + " collections."
-        # )
-        # logging.info(".... found " + str(len(dict_context.keys())) + " contexts.")
-
-        # for collection_uri in dict_collections.keys():
-        #     collection = NifContextCollection(uri=collection_uri)
-        #     for predicate in dict_collections[collection_uri].keys():
-        #         if predicate == NIF.hasContext:
-        #             for context_uri in dict_collections[collection_uri][predicate]:
-        #                 if isinstance(
-        #                     self.store,
-        #                     rdflib.plugins.stores.sparqlstore.SPARQLUpdateStore,
-        #                 ):
-        #                     graph = self.context_graph(uri=context_uri)
-        #                 else:
-        #                     graph = self
-
-        #                 nif_context = NifContext(
-        #                     URIScheme=self.URIScheme,
-        #                     uri=context_uri,
-        #                     graph=graph,
-        #                 )
-        #                 collection.add_context(context=nif_context)
-        #     return collection
-        # else:
-        #     collection = NifContextCollection(uri=uri)
-        #     for context_uri in dict_context.keys():
-        #         if isinstance(
-        #             self.store, rdflib.plugins.stores.sparqlstore.SPARQLUpdateStore
-        #         ):
-        #             graph = self.context_graph(uri=context_uri)
-        #         else:
-        #             graph = self
-
-        #         nif_context = NifContext(
-        #             URIScheme=self.URIScheme,
-        #             uri=context_uri,
-        #             graph=graph,
-        #         )
-        #         collection.add_context(context=nif_context)
-        #     return collection
+        collections = self.collections
+        if collections:
+            return collections[0]
+
+        contexts = self.__contexts_bulk()
+        logging.info(".... found %d contexts.", len(contexts))
+        return NifContextCollection(
+            uri=uri,
+            hasContext=list(contexts.values()),
+            graph=self,
+        )
+
+    def __contexts_bulk(self) -> dict:
+        """
+        Constructs all nif:Context in the graph from a single pass over their
+        statements, instead of separate graph lookups for each context
+
+        The predLang is left to the getter of the context, which returns the
+        value of a literal, set_predLang would keep it as a Literal.
+
+        :return: dict of NifContext by uri
+
+        """
+        by_pred, _ = self.query_rdf_type(NIF.Context)
+        metadata = {p: by_pred[p] for p in by_pred if p in DC or p in DCTERMS}
+        contexts = dict()
+        for context_uri in by_pred[RDF.type]:
+            contexts[context_uri] = NifContext(
+                URIScheme=self.URIScheme,
+                uri=context_uri,
+                sourceUrl=by_pred[NIF.sourceUrl].get(context_uri, None),
+                isString=by_pred[NIF.isString].get(context_uri, None),
+                metadata={
+                    p: values[context_uri]
+                    for p, values in metadata.items()
+                    if context_uri in values
+                },
+                graph=self,
+            )
+        return contexts
 
     @property
     def catalog(self):
         """ """
         # derive the conformsTo from the collection
+        by_pred, by_pred_list = self.query_rdf_type(NIF.ContextCollection)
+        context_collection = dict()
+        context_conformsTo = dict()
+        for c, context_uris in by_pred_list[NIF.hasContext].items():
+            for context_uri in context_uris:
+                context_collection[context_uri] = c
+                context_conformsTo[context_uri] = by_pred[DCTERMS.conformsTo].get(c)
+
+        # find all context in the graphs with corresponding data
+        # statements are streamed into the per-predicate dicts, the contexts
+        # (in order of traversal) are the keys of the rdf:type dict
+        by_pred, _ = self.query_rdf_type(NIF.Context)
+        contexts = by_pred[RDF.type]
+
+        # construct DataFrame with a column for each dc and dcterms predicate
+        data = dict()
+        for predicate, values in by_pred.items():
+            col = predicate.n3(self.namespace_manager)
+            if "dc:" in col or "dcterms:" in col:
+                data[col] = {
+                    idx: val.value if isinstance(val, Literal) else val
+                    for idx, val in values.items()
+                }
+        df = pd.DataFrame(data, index=pd.Index(contexts.keys()))
+
+        if not context_collection.keys().isdisjoint(contexts):
+            df[DCTERMS.conformsTo] = df.index.map(context_conformsTo)
+            df[NIF.ContextCollection] = df.index.map(context_collection)
+        df = df.reindex(sorted(df.columns), axis=1)
+        return df
+
+    def __rdf_type_statements(self, rdf_type: URIRef = None):
+        """
+        Generates all statements of the subjects with the given rdf:type
+
+        For local stores the graph indices are traversed directly, remote
+        stores are queried with SPARQL.
+
+        :param rdf_type: the rdf:type of the subjects
+
+        """
         if isinstance(self.store, sparqlstore.SPARQLUpdateStore):
             q = (
                 """
@@ -298,131 +610,44 @@ class NifGraph(Graph):
                 + self.store.query_endpoint
                 + """>
                 {
-                    ?s rdf:type nif:ContextCollection .
+                    ?s rdf:type """
+                + rdf_type.n3(self.namespace_manager)
+                + """ .
                     ?s ?p ?o .
                 }
             }"""
             )
+            for s, p, o in self.query(q):
+                yield (s, p, o)
         else:
-            q = """
-            SELECT ?s ?p ?o
-            WHERE {
-                ?s rdf:type nif:ContextCollection .
-                ?s ?p ?o .
-            }"""
-        results = self.query(q)
-        collections = defaultdict(dict)
-        for s, p, o in results:
-            if p == NIF.hasContext:
-                if collections[s].get(p, None) is None:
-                    collections[s][p] = [o]
-                else:
-                    collections[s][p].append(o)
-            else:
-                collections[s][p] = o
+            for s in self.subjects(RDF.type, rdf_type):
+                for p, o in self.predicate_objects(subject=s):
+                    yield (s, p, o)
 
-        # find all context in the graphs with corresponding data
-        if isinstance(self.store, sparqlstore.SPARQLUpdateStore):
-            q = (
-                """
-            SELECT ?s ?p ?o 
-            WHERE { 
-                SERVICE <"""
-                + self.store.query_endpoint
-                + """>
-                {
-                    ?s rdf:type nif:Context . ?s ?p ?o . 
-                }
-            }"""
-            )
-        else:
-            q = """
-            SELECT ?s ?p ?o 
-            WHERE { 
-                ?s rdf:type nif:Context . ?s ?p ?o . 
-            }"""
-        results = self.query(q)
+    def query_rdf_type(self, rdf_type: URIRef = None):
+        """
+        Returns all statements of the subjects with the given rdf:type
 
-        # construct DataFrame from query results
-        d = defaultdict(dict)
-        index = list()
-        columns = set()
-        for result in results:
-            idx = result[0]
-            col = result[1].n3(self.namespace_manager)
-            if isinstance(result[2], Literal):
-                val = result[2].value
+        :param rdf_type: the rdf:type of the subjects
+
+        :return: a dict with for each predicate a dict of subjects and objects,
+            and a dict with for each predicate a dict of subjects and lists of
+            objects (for nif:hasContext and OLIA objects)
+
+        """
+        results = self.__rdf_type_statements(rdf_type)
+
+        by_pred = defaultdict(dict)
+        by_pred_list = defaultdict(lambda: defaultdict(list))
+        for s, p, o in results:
+            if p == NIF.hasContext or (
+                isinstance(o, URIRef) and o.startswith(OLIA_PREFIX)
+            ):
+                by_pred_list[p][s].append(o)
             else:
-                val = result[2]
-            if "dc:" in col or "dcterms:" in col:
-                d[idx][col] = val
-                columns.add(col)
-            if idx not in index:
-                index.append(idx)
-
-        df = pd.DataFrame(
-            index=index,
-            columns=list(columns),
-            data=[[d[idx][col] for col in columns] for idx in index],
-        )
-        for idx in df.index:
-            for c in collections.keys():
-                if idx in collections[c][NIF.hasContext]:
-                    df.loc[idx, DCTERMS.conformsTo] = collections[c][DCTERMS.conformsTo]
-                    df.loc[idx, NIF.ContextCollection] = c
-        df = df.reindex(sorted(df.columns), axis=1)
-        return df
+                by_pred[p][s] = o
 
-    # def query_rdf_type(self, rdf_type: URIRef = None):
-    #     if isinstance(self.store, sparqlstore.SPARQLUpdateStore):
-    #         q = (
-    #             """
-    #         SELECT ?s ?p ?o
-    #         WHERE {
-    #             SERVICE <"""
-    #             + self.store.query_endpoint
-    #             + """>
-    #             {
-    #                 ?s rdf:type """
-    #             + rdf_type.n3(self.namespace_manager)
-    #             + """ .
-    #                 ?s ?p ?o .
-    #             }
-    #         }"""
-    #         )
-    #     else:
-    #         q = (
-    #             """
-    #         SELECT ?s ?p ?o
-    #         WHERE {
-    #             ?s rdf:type """
-    #             + rdf_type.n3(self.namespace_manager)
-    #             + """ .
-    #             ?s ?p ?o .
-    #         }"""
-    #         )
-    #     results = self.query(q)
-
-    #     d = defaultdict(dict)
-    #     for result in results:
-    #         idx = result[0]
-    #         col = result[1]
-    #         val = result[2]
-
-    #         if col == NIF.hasContext:
-    #             if col in d[idx].keys():
-    #                 d[idx][col].append(val)
-    #             else:
-    #                 d[idx][col] = [val]
-    #         elif val in OLIA:
-    #             if col in d[idx].keys():
-    #                 d[idx][col].append(val)
-    #             else:
-    #                 d[idx][col] = [val]
-    #         else:
-    #             d[idx][col] = val
-
-    #     return d
+        return by_pred, by_pred_list
 
     def context_graph(self, uri: URIRef = None):
         """ """
@@ -513,7 +738,7 @@ class NifGraph(Graph):
                     lang = "en"
 
                 # construct lexicon if necessary
-                if lang not in lexica.keys():
+                if lang not in lexica:
                     lexica[lang] = Lexicon(uri=URIRef(DEFAULT_URI + "lexicon/" + lang))
                     lexica[lang].set_language(lang)
 
@@ -564,7 +789,7 @@ class NifGraph(Graph):
             if len(r) > 0:
                 rdf_type = r[0][2]
             else:
-                logging.warning("uri not found: " + str(uri))
+                logging.warning("uri not found: %s", uri)
                 return None
 
             if rdf_type == NIF.ContextCollection:
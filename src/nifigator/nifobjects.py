@@ -291,8 +291,8 @@ class NifString(NifBase):
         if self.anchorOf is not None:
             if str(anchorOf) != self.anchorOf:
                 logging.error(
-                    "Inconsistency in anchorOf string and (part in) referenceContext string: "
-                    + str(uri)
+                    "Inconsistency in anchorOf string and (part in) referenceContext string: %s",
+                    self.uri,
                 )
         # if isinstance(anchorOf, str):
         #     self._anchorOf = Literal(anchorOf, datatype=XSD.string)
@@ -397,7 +397,7 @@ class NifContext(NifString):
         if self.lastSentence is not None:
             s += f"  lastSentence : {repr(self.lastSentence.anchorOf)}\n"
         if self._metadata is not None and self._metadata != {}:
-            for d in self._metadata.keys():
+            for d in self._metadata:
                 s += f"  {d} : {self._metadata[d]}\n"
         return s
 
@@ -732,7 +732,7 @@ class NifContext(NifString):
         if objects is None or any([isinstance(self, obj) for obj in objects]):
             if self.uri is not None:
                 yield (self.uri, RDF.type, NIF.Context)
-                for key in self._metadata.keys():
+                for key in self._metadata:
                     yield (self.uri, key, self._metadata[key])
                 if self._isString is not None:
                     yield (self.uri, NIF.isString, self._isString)
@@ -949,11 +949,11 @@ class NifContext(NifString):
 
                     upos = word.get("upos", None)
                     if upos is not None:
-                        if upos in upos2olia.keys():
+                        if upos in upos2olia:
                             nif_word.add_pos(upos2olia.get(word["upos"]))
                         else:
                             logging.error(
-                                ".. part-of-speech tag not found: " + word["upos"]
+                                ".. part-of-speech tag not found: %s", word["upos"]
                             )
                     feats = word.get("feats", None)
                     if feats is not None:
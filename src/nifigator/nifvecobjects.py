@@ -121,7 +121,7 @@ class NifVectorGraph(NifGraph):
                     if isString is not None:
                         documents[context.uri] = preprocess(isString, self.params)
                     else:
-                        logging.warning("No isString found for " + str(context.uri))
+                        logging.warning("No isString found for %s", context.uri)
 
         if documents is not None:
             phrases = generate_document_phrases(documents=documents, params=self.params)
@@ -498,7 +498,7 @@ class NifVectorGraph(NifGraph):
         }
         for phrase in phrases:
             phrase_contexts = g.phrase_contexts(phrase, topn=None)
-            d["data"].append([phrase_contexts.get(c, 0) for c in contexts.keys()])
+            d["data"].append([phrase_contexts.get(c, 0) for c in contexts])
         return d
 
     def context_phrases(
@@ -649,7 +649,7 @@ class NifVectorGraph(NifGraph):
         }
 
         phrases = generate_document_phrases(documents=documents, params=params)
-        for phrase in phrases.keys():
+        for phrase in phrases:
             if includePhraseVectors:
                 if vectors.get(phrase, None) is None:
                     if includeOtherForms:
@@ -692,10 +692,10 @@ def document_vector(
         )
     res = dict()
     if includePhraseVectors:
-        for phrase in phrases.keys():
+        for phrase in phrases:
             p = phrase.replace(phrase_sep, " ")
-            if p not in vectors.keys():
-                logging.debug("Phrase " + repr(p) + " not found in vectors.")
+            if p not in vectors:
+                logging.debug("Phrase %r not found in vectors.", p)
             else:
                 res[p] = Counter(
                     {
@@ -704,10 +704,10 @@ def document_vector(
                     }
                 )
     if includeContextVectors:
-        for left, right in contexts.keys():
+        for left, right in contexts:
             c = (left.replace(phrase_sep, " "), right.replace(phrase_sep, " "))
-            if c not in vectors.keys():
-                logging.debug("Context " + repr(c) + " not found in vectors.")
+            if c not in vectors:
+                logging.debug("Context %r not found in vectors.", c)
             else:
                 res[c] = Counter(
                     {
@@ -749,7 +749,7 @@ def generate_document_contexts(
 
     to_process_contexts = dict()
     for d_context, d_phrases in init_contexts.items():
-        if len(d_phrases.keys()) > 1:
+        if len(d_phrases) > 1:
             to_process_contexts[d_context] = (d_phrases, 1, 1)
 
     # aggegrate results into contexts dict
@@ -763,17 +763,17 @@ def generate_document_contexts(
             }
         )
         if (
-            len(d_phrase_counter.keys()) > 0
+            len(d_phrase_counter) > 0
             and sum(v for v in d_phrase_counter.values()) >= min_context_count
         ):
             final_contexts[d_context] = d_phrase_counter
         else:
-            if d_context in to_process_contexts.keys():
+            if d_context in to_process_contexts:
                 del to_process_contexts[d_context]
 
     del init_contexts
 
-    logging.debug(".... added contexts: " + str(len(to_process_contexts)))
+    logging.debug(".... added contexts: %d", len(to_process_contexts))
 
     while to_process_contexts != dict():
         new_contexts = defaultdict(lambda: defaultdict(lambda: defaultdict(set)))
@@ -824,7 +824,7 @@ def generate_document_contexts(
         to_process_contexts = dict()
         for ((left_part, right_part)), d_phrases in new_contexts.items():
             if (
-                len(d_phrases.keys()) > 1
+                len(d_phrases) > 1
                 and len(left_part.split(phrase_sep)) < max_context_length
                 and len(right_part.split(phrase_sep)) < max_context_length
             ):
@@ -844,15 +844,15 @@ def generate_document_contexts(
                 }
             )
             if (
-                len(d_phrase_counter.keys()) > 0
+                len(d_phrase_counter) > 0
                 and sum(v for v in d_phrase_counter.values()) >= min_context_count
             ):
                 final_contexts[d_context] = d_phrase_counter
             else:
-                if d_context in to_process_contexts.keys():
+                if d_context in to_process_contexts:
                     del to_process_contexts[d_context]
 
-        logging.debug(".... added contexts: " + str(len(to_process_contexts)))
+        logging.debug(".... added contexts: %d", len(to_process_contexts))
 
     # create final phrases dict from contexts
     phrases = Counter()
@@ -861,8 +861,8 @@ def generate_document_contexts(
             phrases[phrase] += value
 
     logging.debug(".. generate document contexts finished")
-    logging.debug(".... total contexts: " + str(len(final_contexts.keys())))
-    logging.debug(".... total phrases: " + str(len(phrases.keys())))
+    logging.debug(".... total contexts: %d", len(final_contexts))
+    logging.debug(".... total phrases: %d", len(phrases))
 
     return final_contexts, phrases
 
@@ -894,7 +894,7 @@ def generate_document_phrases(documents: dict = None, params: dict = {}):
     for phrase in to_delete:
         del phrases[phrase]
 
-    logging.debug(".... found phrases: " + str(len(phrases.keys())))
+    logging.debug(".... found phrases: %d", len(phrases))
 
     return phrases
 
@@ -207,18 +207,18 @@ class PDFDocument:
                 page_end_correction = sum(
                     [hyphen.end() - hyphen.start() for hyphen in text_hyphens]
                 )
-                if logging.DEBUG and page_end_correction > 0:
+                if page_end_correction > 0:
                     logging.debug(
-                        "nifigator.pdfparser.page_offsets: page_start "
-                        + str(page_start)
-                        + " corrected with "
-                        + str(page_start_correction)
+                        "nifigator.pdfparser.page_offsets: "
+                        "page_start %s corrected with %s",
+                        page_start,
+                        page_start_correction,
                     )
                     logging.debug(
-                        "nifigator.pdfparser.page_offsets: page_end   "
-                        + str(page_end)
-                        + " corrected with "
-                        + str(page_end_correction)
+                        "nifigator.pdfparser.page_offsets: "
+                        "page_end   %s corrected with %s",
+                        page_end,
+                        page_end_correction,
                     )
                 # append corrected page offsets
                 page_offsets.append(
@@ -113,7 +113,7 @@ class MinHashSearch:
         )
         lshensemble.index(
             [
-                (key, self.minhash_documents[key], len(value.keys()))
+                (key, self.minhash_documents[key], len(value))
                 for key, value in documents.items()
             ]
         )
@@ -129,7 +129,7 @@ class MinHashSearch:
         mh = dict()
         for key, elements in documents.items():
             mh[key] = MinHash(num_perm=self.num_perm)
-            for element in elements.keys():
+            for element in elements:
                 mh[key].merge(self.minhash_dict[element])
         return mh
 
@@ -146,11 +146,11 @@ class MinHashSearch:
         # create minhash of the query
         v = document_vector({"query": query}, self.base_vectors)
         minhash_query = MinHash(num_perm=self.num_perm)
-        for element in v.keys():
+        for element in v:
             minhash_query.merge(self.minhash_dict[element])
         # determine scores from the lshensemble
         scores = dict()
-        for doc in self.lshensemble.query(minhash_query, len(v.keys())):
+        for doc in self.lshensemble.query(minhash_query, len(v)):
             # for each doc calculate the containment score
             c1 = merge_multiset(v).keys()
             c2 = merge_multiset(self.documents[doc]).keys()
@@ -187,7 +187,7 @@ class MinHashSearch:
                 (p2, 1 - containment_index(c2, c1))
                 for p2, c2 in v2.items()
                 if 1 - containment_index(c2, c1) < 1
-                and p1 not in full_matches.keys()
+                and p1 not in full_matches
                 and p2 not in [p[0] for p in full_matches.values()]
             ]
             for p1, c1 in v1.items()
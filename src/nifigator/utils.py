@@ -4,6 +4,7 @@ import datetime
 import logging
 import re
 import uuid
+from functools import lru_cache
 from io import StringIO
 
 import unidecode
@@ -121,9 +122,10 @@ def align_stanza_dict_offsets(stanza_dict: list = None, sentences: list = None):
     return stanza_dict
 
 
+@lru_cache(maxsize=4096)
 def generate_uuid(uri: str = None, prefix: str = "nif-"):
     """
-    Function to generate the uuid for nif
+    Function to generate the uuid for nif, results are cached
 
     :param uri: the uri from which the uuid should be generated
 
@@ -227,7 +229,7 @@ def delete_accents(text: str = None, lang: str = "en"):
             "ῲ": "ῳ",
             "ῴ": "ῳ",
         }
-        for replacement in replacements.keys():
+        for replacement in replacements:
             text = text.replace(replacement, replacements[replacement])
     else:
         text = unidecode.unidecode(text)
@@ -480,7 +482,7 @@ def delete_diacritics(text: str = None, lang: str = "en"):
             "Ώ": "Ω",
             "ꭥ": "Ω",
         }
-        for replacement in replacements.keys():
+        for replacement in replacements:
             text = text.replace(replacement, replacements[replacement])
     else:
         text = unidecode.unidecode(text)
@@ -515,9 +517,9 @@ def load_dtd(dtd_url: str) -> etree.DTD:
         dtd_file_object = StringIO(r.read())
         dtd = etree.DTD(dtd_file_object)
     if dtd is None:
-        logging.error("failed to load dtd from" + str(dtd_url))
+        logging.error("failed to load dtd from %s", dtd_url)
     else:
-        logging.info("Succesfully to load dtd from" + str(dtd_url))
+        logging.info("Succesfully to load dtd from %s", dtd_url)
     return dtd
 
 
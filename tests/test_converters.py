@@ -0,0 +1,71 @@
+import nifigator
+
+from rdflib import Graph
+from rdflib.compare import isomorphic
+from rdflib.term import URIRef
+
+NAF = """<?xml version="1.0" encoding="UTF-8"?>
+<NAF xmlns:dc="http://purl.org/dc/elements/1.1/" xml:lang="en" version="v3.1">
+  <nafHeader>
+    <fileDesc creationtime="2023-01-01T00:00:00" filename="doc_1.pdf"/>
+    <public dc:uri="https://mangosaurus.eu/rdf-data/doc_1.pdf"/>
+  </nafHeader>
+  <raw>The cat sat. Felix ran.</raw>
+  <text>
+    <wf id="w1" sent="1" para="1" page="1" offset="0" length="3">The</wf>
+    <wf id="w2" sent="1" para="1" page="1" offset="4" length="3">cat</wf>
+    <wf id="w3" sent="1" para="1" page="1" offset="8" length="3">sat</wf>
+    <wf id="w4" sent="1" para="1" page="1" offset="11" length="1">.</wf>
+    <wf id="w5" sent="2" para="2" page="2" offset="13" length="5">Felix</wf>
+    <wf id="w6" sent="2" para="2" page="2" offset="19" length="3">ran</wf>
+    <wf id="w7" sent="2" para="2" page="2" offset="22" length="1">.</wf>
+  </text>
+  <terms>
+    <term id="t1" lemma="the" pos="DET"><span><target id="w1"/></span></term>
+    <term id="t2" lemma="cat" pos="NOUN" morphofeat="Number=Sing">
+      <span><target id="w2"/></span>
+    </term>
+    <term id="t3" lemma="sit" pos="VERB"><span><target id="w3"/></span></term>
+    <term id="t4" lemma="." pos="PUNCT"><span><target id="w4"/></span></term>
+    <term id="t5" lemma="Felix" pos="PROPN"><span><target id="w5"/></span></term>
+    <term id="t6" lemma="run" pos="VERB"><span><target id="w6"/></span></term>
+    <term id="t7" lemma="." pos="PUNCT"><span><target id="w7"/></span></term>
+  </terms>
+  <deps>
+    <dep from_term="t2" to_term="t1" rfunc="det"/>
+    <dep from_term="t3" to_term="t2" rfunc="nsubj"/>
+  </deps>
+  <entities>
+    <entity id="e1" type="PERSON"><span><target id="t5"/></span></entity>
+  </entities>
+</NAF>
+"""
+
+
+def test_naf_converter_triples(tmp_path):
+    naf_file = tmp_path / "doc_1.naf.xml"
+    naf_file.write_text(NAF, encoding="utf-8")
+    nafdocument = nifigator.NafDocument().open(str(naf_file))
+
+    params = dict(
+        collection_name="collection",
+        context_name="doc_1",
+        nafdocument=nafdocument,
+        base_uri=nifigator.DEFAULT_URI,
+        base_prefix=nifigator.DEFAULT_PREFIX,
+        URIScheme=nifigator.OffsetBasedString,
+    )
+    expected = Graph()
+    for triple in nifigator.nafConverter(**params).triples():
+        expected.add(triple)
+    result = Graph()
+    for triple in nifigator.nafConverterTriples(**params):
+        result.add(triple)
+
+    assert isomorphic(result, expected)
+
+    phrases = list(result.subjects(nifigator.RDF.type, nifigator.NIF.EntityOccurrence))
+    assert len(phrases) == 1
+    assert result.value(phrases[0], nifigator.ITSRDF.taClassRef) == URIRef(
+        "https://stanfordnlp.github.io/stanza#PERSON"
+    )
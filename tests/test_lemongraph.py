@@ -0,0 +1,23 @@
+import nifigator
+
+from rdflib.namespace import RDF, RDFS
+from rdflib.term import Literal, URIRef
+
+
+def test_lemon_graph_query_rdf_type():
+    entry = URIRef("https://mangosaurus.eu/rdf-data/lexicon/en/cat")
+    other = URIRef("https://mangosaurus.eu/rdf-data/lexicon/en/dog")
+
+    g = nifigator.LemonGraph()
+    g.add((entry, RDF.type, nifigator.ONTOLEX.LexicalEntry))
+    g.add((entry, RDFS.label, Literal("cat")))
+    g.add((entry, nifigator.LEXINFO.partOfSpeech, nifigator.OLIA.CommonNoun))
+    g.add((entry, nifigator.LEXINFO.number, nifigator.OLIA.Singular))
+    g.add((other, RDFS.label, Literal("dog")))
+
+    d = g.query_rdf_type(nifigator.ONTOLEX.LexicalEntry)
+    assert list(d.keys()) == [entry]
+    assert d[entry][RDF.type] == nifigator.ONTOLEX.LexicalEntry
+    assert d[entry][RDFS.label] == Literal("cat")
+    assert d[entry][nifigator.LEXINFO.partOfSpeech] == [nifigator.OLIA.CommonNoun]
+    assert d[entry][nifigator.LEXINFO.number] == [nifigator.OLIA.Singular]
@@ -0,0 +1,333 @@
+from zipfile import ZIP_STORED, ZipFile
+
+import pandas as pd
+import pytest
+
+import nifigator
+
+from rdflib import Graph
+from rdflib.compare import isomorphic
+from rdflib.namespace import DC, DCTERMS, XSD
+from rdflib.plugins.stores.memory import Memory
+from rdflib.store import Store
+from rdflib.term import Literal, URIRef
+
+from .test_converters import NAF
+
+
+def _context(uri, isString):
+    return nifigator.NifContext(
+        uri=uri,
+        URIScheme=nifigator.OffsetBasedString,
+        isString=isString,
+    )
+
+
+def test_nif_graph_collections():
+    shared = _context(
+        "https://mangosaurus.eu/rdf-data/doc_1", "The cat sat on the mat."
+    )
+    other = _context("https://mangosaurus.eu/rdf-data/doc_2", "Felix was his name.")
+
+    collection_1 = nifigator.NifContextCollection(
+        uri="https://mangosaurus.eu/rdf-data/collection_1",
+        conformsTo="https://mangosaurus.eu/rdf-data/version_1",
+    )
+    collection_1.add_context(shared)
+    collection_2 = nifigator.NifContextCollection(
+        uri="https://mangosaurus.eu/rdf-data/collection_2"
+    )
+    collection_2.add_context(shared)
+    collection_2.add_context(other)
+
+    g = nifigator.NifGraph(collection=collection_1)
+    g.open(collection=collection_2)
+
+    collections = {c.uri: c for c in g.collections}
+    assert set(collections.keys()) == {collection_1.uri, collection_2.uri}
+
+    c1 = collections[collection_1.uri]
+    c2 = collections[collection_2.uri]
+    assert c1.conformsTo == URIRef("https://mangosaurus.eu/rdf-data/version_1")
+    assert c2.conformsTo == collection_2.conformsTo
+    assert [c.uri for c in c1.contexts] == [shared.uri]
+    assert {c.uri for c in c2.contexts} == {shared.uri, other.uri}
+
+    # the context in both collections is constructed once
+    c2_contexts = {c.uri: c for c in c2.contexts}
+    assert c1.contexts[0] is c2_contexts[shared.uri]
+    assert c2_contexts[shared.uri].isString == "The cat sat on the mat."
+
+    assert g.collection.uri in collections
+
+
+def test_nif_graph_collection_without_collections():
+    context_1 = _context("https://mangosaurus.eu/rdf-data/doc_1", "The cat sat.")
+    context_2 = _context("https://mangosaurus.eu/rdf-data/doc_2", "Felix was here.")
+
+    g = nifigator.NifGraph()
+    for context in (context_1, context_2):
+        for triple in context.triples():
+            g.add(triple)
+
+    assert g.collections == []
+
+    collection = g.collection
+    assert collection.uri == URIRef(nifigator.DEFAULT_URI)
+    assert {c.uri for c in collection.contexts} == {context_1.uri, context_2.uri}
+
+
+def test_nif_graph_collection_queries_contexts_once(monkeypatch):
+    context = _context("https://mangosaurus.eu/rdf-data/doc_1", "The cat sat.")
+    context.set_predLang("en")
+
+    g = nifigator.NifGraph()
+    for triple in context.triples():
+        g.add(triple)
+
+    rdf_types = []
+    query_rdf_type = nifigator.NifGraph.query_rdf_type
+
+    def counting_query_rdf_type(self, rdf_type=None):
+        rdf_types.append(rdf_type)
+        return query_rdf_type(self, rdf_type)
+
+    monkeypatch.setattr(nifigator.NifGraph, "query_rdf_type", counting_query_rdf_type)
+
+    collection = g.collection
+    assert rdf_types.count(nifigator.NIF.Context) == 1
+    assert collection.contexts[0].predLang == "en"
+    assert isinstance(collection.contexts[0].predLang, str)
+
+
+def _collection():
+    collection = nifigator.NifContextCollection(
+        uri="https://mangosaurus.eu/rdf-data/collection"
+    )
+    collection.add_context(
+        _context("https://mangosaurus.eu/rdf-data/doc_1", "The cat sat.")
+    )
+    collection.add_context(
+        _context("https://mangosaurus.eu/rdf-data/doc_2", "Felix was here.")
+    )
+    return collection
+
+
+def _collection_graph():
+    return nifigator.NifGraph(collection=_collection())
+
+
+def test_nif_graph_zip_workers(tmp_path):
+    g = _collection_graph()
+    zip_file = tmp_path / "graph.zip"
+    with ZipFile(zip_file, mode="w") as z:
+        z.writestr("graph.ttl", g.serialize(format="turtle"))
+        z.writestr("graph.nt", g.serialize(format="nt"))
+        z.writestr("graph.hext", g.serialize(format="hext"))
+
+    sequential = nifigator.NifGraph().open(file=str(zip_file))
+    parallel = nifigator.NifGraph().open(file=str(zip_file), workers=2, batch_size=5)
+
+    assert set(sequential) == set(parallel)
+    assert set(g) <= set(parallel)
+
+
+def test_nif_graph_jelly(tmp_path):
+    pytest.importorskip("pyjelly")
+
+    g = _collection_graph()
+    jelly_file = tmp_path / "graph.jelly"
+    g.serialize(destination=str(jelly_file), format="jelly")
+    zip_file = tmp_path / "graph.zip"
+    with ZipFile(zip_file, mode="w", compression=ZIP_STORED) as z:
+        z.write(jelly_file, "graph.jelly")
+
+    # Jelly writes xsd:string literals as plain literals, so the result is
+    # compared with the file parsed by rdflib itself
+    expected = set(Graph().parse(str(jelly_file), format="jelly"))
+    assert len(expected) == len(g)
+    assert set(nifigator.NifGraph(file=str(jelly_file))) == expected
+    assert set(nifigator.NifGraph(file=str(zip_file))) == expected
+
+
+def test_nif_graph_batch_size():
+    collection = _collection()
+    expected = set(nifigator.NifGraph(collection=collection))
+
+    g = nifigator.NifGraph().open(collection=collection, batch_size=1)
+    assert set(g) == expected
+    g = nifigator.NifGraph().open(collection=collection, batch_size=None)
+    assert set(g) == expected
+
+    with pytest.raises(ValueError):
+        nifigator.NifGraph().open(collection=collection, batch_size=0)
+    with pytest.raises(ValueError):
+        nifigator.NifGraph().open(collection=collection, batch_size=-1)
+
+
+class CountingStore(Store):
+    """A store that is not a memory store and counts the calls of addN"""
+
+    def __init__(self):
+        super().__init__()
+        self.memory = Memory()
+        self.addN_calls = 0
+
+    def add(self, triple, context, quoted=False):
+        self.memory.add(triple, context, quoted)
+
+    def addN(self, quads):
+        self.addN_calls += 1
+        self.memory.addN(quads)
+
+    def triples(self, triple_pattern, context=None):
+        return self.memory.triples(triple_pattern, context)
+
+    def __len__(self, context=None):
+        return self.memory.__len__(context)
+
+    def bind(self, prefix, namespace, override=True):
+        self.memory.bind(prefix, namespace, override)
+
+    def namespace(self, prefix):
+        return self.memory.namespace(prefix)
+
+    def prefix(self, namespace):
+        return self.memory.prefix(namespace)
+
+    def namespaces(self):
+        return self.memory.namespaces()
+
+
+def test_nif_graph_batches_for_other_stores(tmp_path):
+    g = _collection_graph()
+    g.bind("mangosaurus", "https://mangosaurus.eu/rdf-data/")
+    ttl_file = tmp_path / "graph.ttl"
+    g.serialize(destination=str(ttl_file), format="turtle")
+    zip_file = tmp_path / "graph.zip"
+    with ZipFile(zip_file, mode="w") as z:
+        z.write(ttl_file, "graph.ttl")
+        z.writestr("graph.nt", g.serialize(format="nt"))
+    batches = -(-len(g) // 5)
+
+    for file, files in ((ttl_file, 1), (zip_file, 2)):
+        store = CountingStore()
+        result = nifigator.NifGraph(store=store).open(file=str(file), batch_size=5)
+        assert set(result) == set(g)
+        assert store.addN_calls == files * batches
+        assert (
+            "mangosaurus",
+            URIRef("https://mangosaurus.eu/rdf-data/"),
+        ) in list(result.namespaces())
+
+
+def test_nif_graph_parser_oxigraph(tmp_path):
+    pytest.importorskip("oxrdflib")
+
+    ttl_file = tmp_path / "graph.ttl"
+    ttl_file.write_text(
+        "<https://mangosaurus.eu/rdf-data/doc_1> "
+        '<http://purl.org/dc/elements/1.1/title> "Cat" .\n',
+        encoding="utf-8",
+    )
+
+    default = nifigator.NifGraph().open(file=str(ttl_file))
+    oxigraph = nifigator.NifGraph().open(file=str(ttl_file), parser="oxigraph")
+    assert len(oxigraph) == len(default) == 1
+
+    # the oxrdflib parsers read plain literals as xsd:string literals
+    assert list(default.objects()) == [Literal("Cat")]
+    assert list(oxigraph.objects()) == [Literal("Cat", datatype=XSD.string)]
+    assert list(oxigraph.triples((None, None, Literal("Cat")))) == []
+
+
+def test_nif_graph_parser_oxigraph_missing(tmp_path, monkeypatch):
+    monkeypatch.setattr(nifigator.nifgraph, "find_spec", lambda name: None)
+    with pytest.raises(ImportError, match="oxigraph"):
+        nifigator.NifGraph().open(file=str(tmp_path / "graph.ttl"), parser="oxigraph")
+
+
+def test_nif_graph_catalog():
+    def context(uri, isString, metadata):
+        return nifigator.NifContext(
+            uri=uri,
+            URIScheme=nifigator.OffsetBasedString,
+            isString=isString,
+            metadata=metadata,
+        )
+
+    context_1 = context(
+        "https://mangosaurus.eu/rdf-data/doc_1",
+        "The cat sat.",
+        {DC.title: Literal("Cat"), DCTERMS.created: Literal("2020")},
+    )
+    context_2 = context(
+        "https://mangosaurus.eu/rdf-data/doc_2",
+        "Felix ran.",
+        {DC.title: Literal("Felix")},
+    )
+    # a context outside any collection
+    context_3 = context(
+        "https://mangosaurus.eu/rdf-data/doc_3",
+        "A dog.",
+        {DCTERMS.created: Literal("2022")},
+    )
+    collection = nifigator.NifContextCollection(
+        uri="https://mangosaurus.eu/rdf-data/collection",
+        conformsTo="https://mangosaurus.eu/rdf-data/version_1",
+    )
+    collection.add_context(context_1)
+    collection.add_context(context_2)
+
+    g = nifigator.NifGraph(collection=collection)
+    for triple in context_3.triples():
+        g.add(triple)
+
+    df = g.catalog
+    assert sorted(df.index) == [context_1.uri, context_2.uri, context_3.uri]
+    assert list(df.columns) == [
+        "dc:title",
+        "dcterms:created",
+        nifigator.NIF.ContextCollection,
+        DCTERMS.conformsTo,
+    ]
+    assert df.loc[context_1.uri, "dc:title"] == "Cat"
+    assert df.loc[context_1.uri, "dcterms:created"] == "2020"
+    assert df.loc[context_2.uri, "dc:title"] == "Felix"
+    assert pd.isna(df.loc[context_2.uri, "dcterms:created"])
+    assert pd.isna(df.loc[context_3.uri, "dc:title"])
+    assert df.loc[context_3.uri, "dcterms:created"] == "2022"
+    for context_uri in (context_1.uri, context_2.uri):
+        assert df.loc[context_uri, nifigator.NIF.ContextCollection] == collection.uri
+        assert df.loc[context_uri, DCTERMS.conformsTo] == collection.conformsTo
+    assert pd.isna(df.loc[context_3.uri, nifigator.NIF.ContextCollection])
+    assert pd.isna(df.loc[context_3.uri, DCTERMS.conformsTo])
+
+
+def test_nif_graph_nafdocument(tmp_path):
+    naf_file = tmp_path / "doc_1.naf.xml"
+    naf_file.write_text(NAF, encoding="utf-8")
+    nafdocument = nifigator.NafDocument().open(str(naf_file))
+
+    doc_uuid = nifigator.generate_uuid(uri="https://mangosaurus.eu/rdf-data/doc_1.pdf")
+    expected = Graph()
+    for triple in nifigator.nafConverter(
+        collection_name="collection",
+        context_name=doc_uuid,
+        nafdocument=nafdocument,
+        base_uri=nifigator.DEFAULT_URI,
+        base_prefix=nifigator.DEFAULT_PREFIX,
+        URIScheme=nifigator.OffsetBasedString,
+    ).triples():
+        expected.add(triple)
+
+    for g in (
+        nifigator.NifGraph(URIScheme=nifigator.OffsetBasedString).open(
+            file=str(naf_file), batch_size=3
+        ),
+        nifigator.NifGraph(URIScheme=nifigator.OffsetBasedString).open(
+            nafdocument=nafdocument, batch_size=3
+        ),
+    ):
+        assert isomorphic(g, expected)
+        assert g.collection.contexts[0].uri == URIRef(nifigator.DEFAULT_URI + doc_uuid)